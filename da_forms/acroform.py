@@ -0,0 +1,83 @@
+from reportlab.pdfbase.acroform import AcroForm
+from reportlab.pdfbase.pdfdoc import PDFArray, PDFDictionary, PDFString
+from reportlab.pdfgen.canvas import Canvas
+
+# Field attributes a terminal field may inherit from its parent (ISO 32000-1, 12.7.3.1 and 12.7.3.3)
+INHERITABLE_FIELD_KEYS = ('FT', 'Ff', 'DA', 'Q', 'MaxLen')
+
+
+class Da2404AcroForm(AcroForm):
+    """
+    AcroForm which keeps the object graph of large forms small.
+
+    ReportLab registers a new font dictionary for every field, so the appearance stream lookup in
+    ``AcroForm._textfield`` never matches. Font references are cached here so that identical appearances
+    (value, font, size and field dimensions) share a single XObject. Dotted field names such as
+    ``main_item_status.0`` are built as hierarchical fields whose shared parent holds the attributes common
+    to every row.
+
+    This relies on ReportLab internals (``Canvas.AcroForm``, ``PDFDocument.idToObject`` and
+    ``PDFDictionary.dict``), so the ReportLab dependency is limited to the releases it has been tested with.
+    """
+
+    def __init__(self, canv, **kwds):
+        super().__init__(canv, **kwds)
+        self._font_refs = {}
+        self._parents = {}
+
+    def makeFont(self, fontName):
+        if fontName not in self._font_refs:
+            self._font_refs[fontName] = super().makeFont(fontName)
+        return self._font_refs[fontName]
+
+    def get_parent(self, name: str) -> PDFDictionary:
+        if name in self._parents:
+            return self._parents[name]
+        parent_name, _, partial_name = name.rpartition('.')
+        parent = PDFDictionary(dict(T = PDFString(partial_name), Kids = PDFArray([])))
+        parent_ref = self.getRef(parent)
+        if parent_name:
+            grandparent = self.get_parent(parent_name)
+            parent['Parent'] = self.getRef(grandparent)
+            grandparent['Kids'].sequence.append(parent_ref)
+        else:
+            self.fields.append(parent_ref)
+        self._parents[name] = parent
+        return parent
+
+    def textfield(self, name = None, **kwds):
+        if not name or '.' not in name:
+            return super().textfield(name = name, **kwds)
+
+        parent_name, _, partial_name = name.rpartition('.')
+        super().textfield(name = partial_name, **kwds)
+        field_ref = self.fields.pop()
+        field = self.canv._doc.idToObject[field_ref.name]
+
+        parent = self.get_parent(parent_name)
+        is_first_kid = not parent['Kids'].sequence
+        for key in INHERITABLE_FIELD_KEYS:
+            if key not in field:
+                continue
+            if is_first_kid:
+                parent[key] = field[key]
+            if key in parent and self.format_value(parent[key]) == self.format_value(field[key]):
+                del field.dict[key]
+        field['Parent'] = self.getRef(parent)
+        parent['Kids'].sequence.append(field_ref)
+
+    def format_value(self, value) -> bytes:
+        if hasattr(value, 'format'):
+            return value.format(self.canv._doc)
+        return str(value).encode()
+
+
+def get_acro_form(canvas: Canvas) -> Da2404AcroForm:
+    if not hasattr(canvas, 'AcroForm'):
+        canvas._doc._catalog.AcroForm = canvas.AcroForm = Da2404AcroForm(canvas)
+    if not isinstance(canvas.AcroForm, Da2404AcroForm):
+        raise TypeError(
+            f'Canvas already has a {type(canvas.AcroForm).__name__}; '
+            'get_acro_form must be called before anything accesses canvas.acroForm'
+        )
+    return canvas.AcroForm
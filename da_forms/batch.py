@@ -0,0 +1,57 @@
+import heapq
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+
+from da_forms.estimate import CostModel
+from da_forms.generate import create_da_2404
+
+logger = logging.getLogger(__name__)
+
+
+def schedule(da_2404s: list, worker_count: int, cost_model: CostModel = None) -> list:
+    """
+    Assigns the indexes of ``da_2404s`` to ``worker_count`` workers largest-first (LPT), each record going to
+    the worker with the least predicted render time so far. Returns one list of indexes per worker.
+    """
+    if cost_model is None:
+        cost_model = CostModel()
+    costs = [cost_model.estimate(da_2404).render_seconds for da_2404 in da_2404s]
+    workers = [(0.0, worker, []) for worker in range(worker_count)]
+    for index in sorted(range(len(da_2404s)), key = lambda i: costs[i], reverse = True):
+        load, worker, indexes = heapq.heappop(workers)
+        indexes.append(index)
+        heapq.heappush(workers, (load + costs[index], worker, indexes))
+    return [indexes for _, _, indexes in sorted(workers, key = lambda w: w[1])]
+
+
+def render_da_2404s(da_2404s: list) -> list:
+    pdfs = []
+    for da_2404 in da_2404s:
+        buffer = create_da_2404(da_2404)
+        pdfs.append(buffer.getvalue())
+        buffer.close()
+    return pdfs
+
+
+def create_da_2404_batch(da_2404s: list, worker_count: int = None, cost_model: CostModel = None) -> list:
+    """
+    Renders ``da_2404s`` across a process pool, each worker rendering the records assigned to it by
+    ``schedule`` so that one very large worksheet does not end up queued behind many small ones. Results are
+    returned in the order of ``da_2404s``.
+    """
+    if worker_count is None:
+        worker_count = os.cpu_count() or 1
+    logger.info(f'Generating batch of {len(da_2404s)} DA 2404s across {worker_count} worker(s)')
+    assignments = [indexes for indexes in schedule(da_2404s, worker_count, cost_model) if indexes]
+    buffers = [None] * len(da_2404s)
+    with ProcessPoolExecutor(max_workers = worker_count) as executor:
+        futures = [
+            (indexes, executor.submit(render_da_2404s, [da_2404s[index] for index in indexes]))
+            for indexes in assignments
+        ]
+        for indexes, future in futures:
+            for index, pdf in zip(indexes, future.result()):
+                buffers[index] = BytesIO(pdf)
+    return buffers
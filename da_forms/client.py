@@ -0,0 +1,163 @@
+import argparse
+import json
+import logging
+import os.path
+import socket
+import stat
+import struct
+import sys
+import tempfile
+from io import BytesIO
+
+from da_forms.models import Da2404
+from da_forms.output import write_buffer_to_file
+
+logger = logging.getLogger(__name__)
+
+SOCKET_PATH_VARIABLE = 'DA_FORMS_SOCKET'
+CONNECT_TIMEOUT = 1.0
+RESPONSE_TIMEOUT = 30.0
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+# Each message is a 4 byte big-endian length followed by that many bytes. Responses add a status byte before
+# the length.
+LENGTH_FORMAT = '!I'
+RESPONSE_HEADER_FORMAT = '!BI'
+
+
+class DaemonError(RuntimeError):
+    pass
+
+
+def get_socket_path() -> str:
+    """
+    Socket path from ``DA_FORMS_SOCKET``, otherwise ``da_forms.sock`` in ``$XDG_RUNTIME_DIR`` or in a private
+    per-user directory under the temporary directory.
+    """
+    if os.environ.get(SOCKET_PATH_VARIABLE):
+        return os.environ[SOCKET_PATH_VARIABLE]
+    socket_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if not socket_dir:
+        socket_dir = os.path.join(tempfile.gettempdir(), f'da_forms-{os.getuid()}')
+    return os.path.join(socket_dir, 'da_forms.sock')
+
+
+def check_private_path(path: str):
+    """
+    Raises ``PermissionError`` unless ``path`` is owned by the current user and, for directories, is not
+    accessible to other users, so that no other local user can serve or intercept render requests.
+    """
+    status = os.lstat(path)
+    if status.st_uid != os.getuid():
+        raise PermissionError(f'{path} is not owned by the current user')
+    if stat.S_ISDIR(status.st_mode) and stat.S_IMODE(status.st_mode) & 0o077:
+        raise PermissionError(f'{path} is accessible to other users')
+
+
+def check_socket_path(socket_path: str):
+    check_private_path(os.path.dirname(os.path.abspath(socket_path)))
+    check_private_path(socket_path)
+
+
+def read_exactly(connection: socket.socket, size: int) -> bytes:
+    data = bytearray()
+    while len(data) < size:
+        chunk = connection.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError('Connection closed before the full message was received')
+        data += chunk
+    return bytes(data)
+
+
+def send_request(connection: socket.socket, payload: dict):
+    data = json.dumps(payload).encode('utf-8')
+    connection.sendall(struct.pack(LENGTH_FORMAT, len(data)) + data)
+
+
+def read_request(connection: socket.socket) -> dict:
+    (size,) = struct.unpack(LENGTH_FORMAT, read_exactly(connection, struct.calcsize(LENGTH_FORMAT)))
+    return json.loads(read_exactly(connection, size).decode('utf-8'))
+
+
+def send_response(connection: socket.socket, status: int, data: bytes):
+    connection.sendall(struct.pack(RESPONSE_HEADER_FORMAT, status, len(data)) + data)
+
+
+def read_response(connection: socket.socket) -> bytes:
+    status, size = struct.unpack(
+        RESPONSE_HEADER_FORMAT,
+        read_exactly(connection, struct.calcsize(RESPONSE_HEADER_FORMAT))
+    )
+    data = read_exactly(connection, size)
+    if status != STATUS_OK:
+        raise DaemonError(data.decode('utf-8'))
+    return data
+
+
+def request_da_2404(
+        da_2404: Da2404,
+        linearize: bool = False,
+        socket_path: str = None,
+        connect_timeout: float = CONNECT_TIMEOUT,
+        response_timeout: float = RESPONSE_TIMEOUT
+) -> BytesIO:
+    """
+    Renders ``da_2404`` on a running render daemon. Raises ``OSError`` when no daemon owned by the current user
+    is listening on ``socket_path``, and ``socket.timeout`` when the daemon does not respond in time.
+    """
+    socket_path = socket_path or get_socket_path()
+    check_socket_path(socket_path)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.settimeout(connect_timeout)
+        connection.connect(socket_path)
+        connection.settimeout(response_timeout)
+        send_request(connection, {'da_2404': da_2404.to_dict(), 'linearize': linearize})
+        return BytesIO(read_response(connection))
+
+
+def create_da_2404(da_2404: Da2404, linearize: bool = False, socket_path: str = None) -> BytesIO:
+    """
+    Renders ``da_2404`` on the render daemon when one is running, falling back to rendering in this process.
+    ReportLab is only imported for the fallback, which is also used when the daemon is busy or unresponsive.
+    """
+    try:
+        return request_da_2404(da_2404, linearize, socket_path)
+    except OSError as e:
+        logger.info(f'Render daemon unavailable ({e}), generating DA 2404 in process')
+
+    from da_forms import generate
+    return generate.create_da_2404(da_2404, linearize = linearize)
+
+
+def read_payload(payload_path: str = None) -> Da2404:
+    """
+    Reads a ``Da2404`` from a JSON file of its fields, or from standard input when ``payload_path`` is ``-``.
+    Returns the empty sample form when no path is given.
+    """
+    if not payload_path:
+        return Da2404()
+    if payload_path == '-':
+        return Da2404(**json.load(sys.stdin))
+    with open(payload_path, encoding = 'utf-8') as file:
+        return Da2404(**json.load(file))
+
+
+def write_to_file(
+        output_path: str = 'dist/DA2404.pdf',
+        linearize: bool = False,
+        socket_path: str = None,
+        da_2404: Da2404 = None
+):
+    if da_2404 is None:
+        da_2404 = Da2404()
+    write_buffer_to_file(output_path, create_da_2404(da_2404, linearize, socket_path))
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description = 'Generate a DA 2404 PDF, using the render daemon when running.')
+    parser.add_argument('payload', nargs = '?', help = 'JSON file of Da2404 fields, or - to read standard input')
+    parser.add_argument('-o', '--output', default = 'dist/DA2404.pdf', help = 'Path of the PDF to write')
+    parser.add_argument('--linearize', action = 'store_true', help = 'Write a linearized (fast web view) PDF')
+    args = parser.parse_args(argv)
+    write_to_file(args.output, args.linearize, da_2404 = read_payload(args.payload))
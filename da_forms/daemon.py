@@ -0,0 +1,95 @@
+import logging
+import os
+import signal
+import socket
+import socketserver
+import sys
+
+from da_forms.client import (CONNECT_TIMEOUT, STATUS_ERROR, STATUS_OK, DaemonError, check_private_path,
+                             get_socket_path, read_request, send_response)
+from da_forms.generate import create_da_2404
+from da_forms.models import Da2404
+
+logger = logging.getLogger(__name__)
+
+
+class RenderRequestHandler(socketserver.StreamRequestHandler):
+    # Bounds each read and write on the connection so that a client which stalls cannot block the daemon
+    timeout = CONNECT_TIMEOUT
+
+    def handle(self):
+        try:
+            payload = read_request(self.connection)
+            buffer = create_da_2404(Da2404(**payload['da_2404']), linearize = payload.get('linearize', False))
+        except (ConnectionError, socket.timeout):
+            logger.warning('Client did not send a complete request')
+            return
+        except Exception as e:
+            logger.exception('Failed to generate DA 2404')
+            status, data = STATUS_ERROR, f'{type(e).__name__}: {e}'.encode('utf-8')
+        else:
+            status, data = STATUS_OK, buffer.getvalue()
+            buffer.close()
+        try:
+            send_response(self.connection, status, data)
+        except OSError:
+            logger.warning('Client disconnected before the DA 2404 was sent')
+
+
+class RenderServer(socketserver.UnixStreamServer):
+    """
+    Renders DA 2404s for ``da_forms.client`` over a Unix socket. Requests are handled one at a time since
+    ReportLab keeps module level state while building a document.
+    """
+
+    def __init__(self, socket_path: str = None):
+        self.socket_path = socket_path or get_socket_path()
+        socket_dir = os.path.dirname(os.path.abspath(self.socket_path))
+        os.makedirs(socket_dir, mode = 0o700, exist_ok = True)
+        check_private_path(socket_dir)
+        if os.path.lexists(self.socket_path):
+            remove_stale_socket(self.socket_path)
+        super().__init__(self.socket_path, RenderRequestHandler)
+        os.chmod(self.socket_path, 0o600)
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+
+def remove_stale_socket(socket_path: str):
+    """
+    Removes a socket left behind by a daemon which has exited, raising ``DaemonError`` if a daemon is still
+    listening on it.
+    """
+    check_private_path(socket_path)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.settimeout(CONNECT_TIMEOUT)
+        try:
+            connection.connect(socket_path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            pass
+        else:
+            raise DaemonError(f'A render daemon is already listening on {socket_path}')
+    os.remove(socket_path)
+
+
+def warm_up():
+    """
+    Renders a blank form so that ReportLab's modules and standard font metrics are loaded before the first
+    request arrives. The platypus story is still built from scratch for every request.
+    """
+    create_da_2404(Da2404()).close()
+
+
+def serve(socket_path: str = None):
+    logging.basicConfig(level = logging.INFO)
+    warm_up()
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    with RenderServer(socket_path) as server:
+        logger.info(f'Listening for DA 2404 requests on {server.socket_path}')
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
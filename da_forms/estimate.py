@@ -0,0 +1,151 @@
+import logging
+import random
+import time
+
+from da_forms.generate import create_da_2404, get_form_field_values, get_supplementary_sheet_count
+from da_forms.models import Da2404
+
+logger = logging.getLogger(__name__)
+
+# Coefficients for (constant, pages, filled fields, text characters), produced by ``poetry run calibrate``
+# (``calibrate`` over ``get_calibration_samples``) on Python 3.13.5 with ReportLab 4.3.0 on a single CPU.
+# Render time is dominated by page count.
+DEFAULT_RENDER_SECONDS = (0.037193, 0.028937, 0.000051, 0.0)
+DEFAULT_OUTPUT_BYTES = (-2826.94, 31014.57, 75.13, 5.85)
+
+
+class Da2404Estimate:
+    def __init__(self, **kwargs):
+        self.page_count = kwargs.get('page_count', 0)
+        self.field_count = kwargs.get('field_count', 0)
+        self.filled_field_count = kwargs.get('filled_field_count', 0)
+        self.render_seconds = kwargs.get('render_seconds', 0.0)
+        self.output_bytes = kwargs.get('output_bytes', 0)
+
+
+class CostModel:
+    """
+    Linear model predicting render time and output size of a DA 2404 from its page count, number of filled
+    fields and amount of field text, none of which require invoking ReportLab.
+    """
+
+    def __init__(self, render_seconds = DEFAULT_RENDER_SECONDS, output_bytes = DEFAULT_OUTPUT_BYTES):
+        self.render_seconds = tuple(render_seconds)
+        self.output_bytes = tuple(output_bytes)
+
+    def estimate(self, da_2404: Da2404) -> Da2404Estimate:
+        field_values = get_form_field_values(da_2404)
+        features = get_features(da_2404, field_values)
+        return Da2404Estimate(
+            page_count = features[1],
+            field_count = len(field_values),
+            filled_field_count = features[2],
+            render_seconds = max(predict(self.render_seconds, features), 0.0),
+            output_bytes = max(int(predict(self.output_bytes, features)), 0)
+        )
+
+
+def get_features(da_2404: Da2404, field_values: dict = None) -> tuple:
+    if field_values is None:
+        field_values = get_form_field_values(da_2404)
+    filled_values = [str(value) for value in field_values.values() if value]
+    return (
+        1,
+        1 + get_supplementary_sheet_count(da_2404),
+        len(filled_values),
+        sum(len(value) for value in filled_values)
+    )
+
+
+def predict(coefficients: tuple, features: tuple) -> float:
+    return sum(coefficient * feature for coefficient, feature in zip(coefficients, features))
+
+
+def estimate_da_2404(da_2404: Da2404, cost_model: CostModel = None) -> Da2404Estimate:
+    if cost_model is None:
+        cost_model = CostModel()
+    return cost_model.estimate(da_2404)
+
+
+def fit(features: list, targets: list) -> tuple:
+    """
+    Ordinary least squares via the normal equations. Features which are linearly dependent on earlier ones,
+    such as a constant page count across all samples, get a zero coefficient.
+    """
+    size = len(features[0])
+    matrix = [[sum(row[i] * row[j] for row in features) for j in range(size)] for i in range(size)]
+    vector = [sum(row[i] * target for row, target in zip(features, targets)) for i in range(size)]
+    for column in range(size):
+        pivot = max(range(column, size), key = lambda row: abs(matrix[row][column]))
+        matrix[column], matrix[pivot] = matrix[pivot], matrix[column]
+        vector[column], vector[pivot] = vector[pivot], vector[column]
+        if abs(matrix[column][column]) < 1e-9 * max(abs(matrix[0][0]), 1):
+            matrix[column] = [0.0] * size
+            vector[column] = 0.0
+            continue
+        for row in range(size):
+            if row != column:
+                factor = matrix[row][column] / matrix[column][column]
+                matrix[row] = [a - factor * b for a, b in zip(matrix[row], matrix[column])]
+                vector[row] -= factor * vector[column]
+    return tuple(vector[i] / matrix[i][i] if matrix[i][i] else 0.0 for i in range(size))
+
+
+def get_calibration_samples(seed: int = 1) -> list:
+    """
+    Deterministic sample set used to fit the default coefficients: 0 to 3,000 line items at 0%, 50% and 100%
+    of rows filled, with deficiency text of varying length.
+    """
+    generator = random.Random(seed)
+    samples = []
+    for item_count in (0, 5, 13, 40, 100, 300, 600, 1000, 2000, 3000):
+        for fill in (0.0, 0.5, 1.0):
+            line_items = []
+            for item_number in range(item_count):
+                if generator.random() < fill:
+                    line_items.append({
+                        'item_number': str(item_number),
+                        'status': 'X',
+                        'deficiencies': 'Leaking seal on hub ' * generator.randint(0, 3),
+                        'corrective_action': 'Replaced' if generator.random() < 0.5 else '',
+                    })
+                else:
+                    line_items.append({})
+            samples.append(Da2404(organization = 'A Co', line_items = line_items))
+    return samples
+
+
+def calibrate(samples: list, repeat: int = 1) -> CostModel:
+    """
+    Renders each ``Da2404`` in ``samples`` and fits a ``CostModel`` to the measured render times and sizes,
+    taking the fastest of ``repeat`` renders to reduce timing noise.
+    """
+    features = []
+    render_seconds = []
+    output_bytes = []
+    for da_2404 in samples:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            buffer = create_da_2404(da_2404)
+            timings.append(time.perf_counter() - start)
+        render_seconds.append(min(timings))
+        output_bytes.append(len(buffer.getvalue()))
+        buffer.close()
+        features.append(get_features(da_2404))
+    logger.info(f'Calibrated cost model against {len(samples)} DA 2404 samples')
+    # Text length is collinear with the number of filled fields and has no measurable effect on render time,
+    # so it is left out of the render time fit to keep predictions positive for short values
+    time_features = [(*row[:3], 0) for row in features]
+    return CostModel(fit(time_features, render_seconds), fit(features, output_bytes))
+
+
+def print_calibration():
+    """
+    Fits a ``CostModel`` against ``get_calibration_samples`` and prints its coefficients, for updating the
+    defaults above.
+    """
+    logging.basicConfig(level = logging.INFO)
+    cost_model = calibrate(get_calibration_samples(), repeat = 3)
+    print('DEFAULT_RENDER_SECONDS =', tuple(round(c, 6) for c in cost_model.render_seconds))
+    print('DEFAULT_OUTPUT_BYTES =', tuple(round(c, 2) for c in cost_model.output_bytes))
@@ -0,0 +1,137 @@
+import hashlib
+import logging
+import os.path
+from functools import lru_cache
+from xml.etree import ElementTree
+
+from da_forms.generate import create_da_2404, get_form_field_values, get_supplementary_sheet_count
+from da_forms.models import Da2404
+
+logger = logging.getLogger(__name__)
+
+XFDF_NAMESPACE = 'http://ns.adobe.com/xfdf/'
+
+
+@lru_cache(maxsize = None)
+def create_blank_da_2404(supplementary_sheet_count: int) -> bytes:
+    """
+    Renders an empty DA 2404 with the given number of supplementary sheets. Only the AcroForm values differ
+    between records, so a single blank is rendered per sheet count and reused for every record.
+    """
+    logger.info(f'Generating blank DA 2404 template with {supplementary_sheet_count} supplementary sheet(s)')
+    buffer = create_da_2404(Da2404(), supplementary_sheet_count)
+    pdf = buffer.getvalue()
+    buffer.close()
+    return pdf
+
+
+def get_template_name(supplementary_sheet_count: int) -> str:
+    """
+    Template file name for the given sheet count. The name includes a hash of the fully qualified field names
+    so that a template left on disk by a release with a different field layout is never reused.
+    """
+    field_names = '\n'.join(get_form_field_values(Da2404(), supplementary_sheet_count))
+    layout_hash = hashlib.sha1(field_names.encode('utf-8')).hexdigest()[:8]
+    return f'DA2404_blank_{supplementary_sheet_count}_{layout_hash}.pdf'
+
+
+def write_template(output_dir: str, supplementary_sheet_count: int) -> str:
+    output_path = os.path.join(output_dir, get_template_name(supplementary_sheet_count))
+    if os.path.exists(output_path):
+        return output_path
+    if output_dir and not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+    with open(output_path, 'wb+') as file:
+        file.write(create_blank_da_2404(supplementary_sheet_count))
+    return output_path
+
+
+def get_filled_field_values(da_2404: Da2404) -> dict:
+    """
+    Field values for ``da_2404``, omitting empty fields since the blank template already renders them.
+    """
+    return {name: str(value) for name, value in get_form_field_values(da_2404).items() if value}
+
+
+def get_field_tree(field_values: dict) -> dict:
+    """
+    Nests fully qualified field names such as ``main_item_status.0`` under their parent fields.
+    """
+    tree = {}
+    for name, value in field_values.items():
+        *parent_names, partial_name = name.split('.')
+        node = tree
+        for parent_name in parent_names:
+            node = node.setdefault(parent_name, {})
+        node[partial_name] = value
+    return tree
+
+
+def escape_pdf_string(value: str) -> str:
+    try:
+        value.encode('latin-1')
+    except UnicodeEncodeError:
+        return '<FEFF' + value.encode('utf-16-be').hex().upper() + '>'
+    escaped = value.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)').replace('\r', '\\r')
+    return f'({escaped})'
+
+
+def get_fdf_fields(tree: dict) -> str:
+    fields = []
+    for name, value in tree.items():
+        if isinstance(value, dict):
+            fields.append(f'<</T{escape_pdf_string(name)}/Kids[{get_fdf_fields(value)}]>>')
+        else:
+            fields.append(f'<</T{escape_pdf_string(name)}/V{escape_pdf_string(value)}>>')
+    return ''.join(fields)
+
+
+def create_fdf(da_2404: Da2404, template_name: str = None) -> bytes:
+    if template_name is None:
+        template_name = get_template_name(get_supplementary_sheet_count(da_2404))
+    fields = get_fdf_fields(get_field_tree(get_filled_field_values(da_2404)))
+    fdf = '%FDF-1.2\n' \
+          '1 0 obj\n' \
+          f'<</FDF<</F{escape_pdf_string(template_name)}/Fields[{fields}]>>>>\n' \
+          'endobj\n' \
+          'trailer\n' \
+          '<</Root 1 0 R>>\n' \
+          '%%EOF\n'
+    return fdf.encode('latin-1')
+
+
+def add_xfdf_fields(element: ElementTree.Element, tree: dict):
+    for name, value in tree.items():
+        field = ElementTree.SubElement(element, 'field', {'name': name})
+        if isinstance(value, dict):
+            add_xfdf_fields(field, value)
+        else:
+            ElementTree.SubElement(field, 'value').text = value
+
+
+def create_xfdf(da_2404: Da2404, template_name: str = None) -> bytes:
+    if template_name is None:
+        template_name = get_template_name(get_supplementary_sheet_count(da_2404))
+    root = ElementTree.Element('xfdf', {'xmlns': XFDF_NAMESPACE, 'xml:space': 'preserve'})
+    ElementTree.SubElement(root, 'f', {'href': template_name})
+    add_xfdf_fields(ElementTree.SubElement(root, 'fields'), get_field_tree(get_filled_field_values(da_2404)))
+    return ElementTree.tostring(root, encoding = 'utf-8', xml_declaration = True)
+
+
+def write_data_to_file(da_2404: Da2404, output_path: str, template_dir: str = None) -> str:
+    """
+    Writes the values of ``da_2404`` as FDF, or XFDF when ``output_path`` ends in ``.xfdf``, alongside the
+    shared blank template for its sheet count. Returns the path of the template the data file refers to.
+    """
+    output_dir = os.path.dirname(output_path)
+    if template_dir is None:
+        template_dir = output_dir
+    template_path = write_template(template_dir, get_supplementary_sheet_count(da_2404))
+    template_name = os.path.relpath(template_path, output_dir or '.')
+    if output_path.lower().endswith('.xfdf'):
+        data = create_xfdf(da_2404, template_name)
+    else:
+        data = create_fdf(da_2404, template_name)
+    with open(output_path, 'wb+') as file:
+        file.write(data)
+    return template_path
@@ -1,6 +1,5 @@
 import logging
 import math
-import os.path
 from io import BytesIO
 
 from reportlab.lib import colors
@@ -11,7 +10,9 @@ from reportlab.lib.units import mm
 from reportlab.pdfgen.canvas import Canvas
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, PageBreak
 
+from da_forms.acroform import get_acro_form
 from da_forms.models import Da2404, Da2404LineItem
+from da_forms.output import write_buffer_to_file
 
 logger = logging.getLogger(__name__)
 
@@ -442,7 +443,7 @@ def get_supplementary_sheet():
 
 
 def add_header_data_form(canvas: Canvas, da_2404: Da2404):
-    form = canvas.acroForm
+    form = get_acro_form(canvas)
     form.textfield(
         name = 'organization',
         tooltip = 'Organization',
@@ -536,7 +537,7 @@ def add_header_data_form(canvas: Canvas, da_2404: Da2404):
 
 
 def add_applicable_reference_form(canvas: Canvas, da_2404: Da2404):
-    form = canvas.acroForm
+    form = get_acro_form(canvas)
     form.textfield(
         name = 'tm_number_a',
         tooltip = 'TM Number',
@@ -580,7 +581,7 @@ def add_applicable_reference_form(canvas: Canvas, da_2404: Da2404):
 
 
 def add_signature_form(canvas: Canvas, da_2404: Da2404):
-    form = canvas.acroForm
+    form = get_acro_form(canvas)
     form.textfield(
         name = 'time_a',
         tooltip = 'Time',
@@ -613,15 +614,18 @@ def add_signature_form(canvas: Canvas, da_2404: Da2404):
     )
 
 
+def get_line_item(da_2404: Da2404, index) -> Da2404LineItem:
+    if len(da_2404.line_items) > index:
+        return da_2404.line_items[index]
+    return Da2404LineItem()
+
+
 def add_item_table_form(canvas: Canvas, da_2404: Da2404):
-    form = canvas.acroForm
+    form = get_acro_form(canvas)
     for line_number in range(0, MAIN_PAGE_ITEMS):
-        if len(da_2404.line_items) > line_number:
-            line_item = da_2404.line_items[line_number]
-        else:
-            line_item = Da2404LineItem()
+        line_item = get_line_item(da_2404, line_number)
         form.textfield(
-            name = f'main_item_number_{line_number}',
+            name = f'main_item_number.{line_number}',
             tooltip = 'Item Number',
             x = 13 * mm,
             y = letter[1] - (158.5 * mm) - (line_number * 8.75 * mm),
@@ -632,7 +636,7 @@ def add_item_table_form(canvas: Canvas, da_2404: Da2404):
             value = line_item.item_number
         )
         form.textfield(
-            name = f'main_item_status_{line_number}',
+            name = f'main_item_status.{line_number}',
             tooltip = 'Status',
             x = 26.5 * mm,
             y = letter[1] - (158.5 * mm) - (line_number * 8.75 * mm),
@@ -643,7 +647,7 @@ def add_item_table_form(canvas: Canvas, da_2404: Da2404):
             value = line_item.status
         )
         form.textfield(
-            name = f'main_deficiencies_{line_number}',
+            name = f'main_deficiencies.{line_number}',
             tooltip = 'Deficiencies',
             x = 40 * mm,
             y = letter[1] - (158.5 * mm) - (line_number * 8.75 * mm),
@@ -655,7 +659,7 @@ def add_item_table_form(canvas: Canvas, da_2404: Da2404):
             value = line_item.deficiencies
         )
         form.textfield(
-            name = f'main_corrective_action_{line_number}',
+            name = f'main_corrective_action.{line_number}',
             tooltip = 'Corrective Action',
             x = 111 * mm,
             y = letter[1] - (158.5 * mm) - (line_number * 8.75 * mm),
@@ -669,16 +673,13 @@ def add_item_table_form(canvas: Canvas, da_2404: Da2404):
 
 
 def add_supplementary_sheet_form(canvas: Canvas, da_2404: Da2404, page_number):
-    form = canvas.acroForm
+    form = get_acro_form(canvas)
     base_y = 32.5
     page_index = page_number - 2
     for line_number in range(0, SUPPLEMENTARY_PAGE_ITEMS):
-        if len(da_2404.line_items) > line_number + MAIN_PAGE_ITEMS + (SUPPLEMENTARY_PAGE_ITEMS * page_index):
-            line_item = da_2404.line_items[line_number + MAIN_PAGE_ITEMS + (SUPPLEMENTARY_PAGE_ITEMS * page_index)]
-        else:
-            line_item = Da2404LineItem()
+        line_item = get_line_item(da_2404, line_number + MAIN_PAGE_ITEMS + (SUPPLEMENTARY_PAGE_ITEMS * page_index))
         form.textfield(
-            name = f'supplementary_item_number_{line_number}_{page_index}',
+            name = f'supplementary_item_number.{page_index}.{line_number}',
             tooltip = 'Item Number',
             x = 13 * mm,
             y = letter[1] - (base_y * mm) - (line_number * 8.75 * mm),
@@ -689,7 +690,7 @@ def add_supplementary_sheet_form(canvas: Canvas, da_2404: Da2404, page_number):
             value = line_item.item_number
         )
         form.textfield(
-            name = f'supplementary_item_status_{line_number}_{page_index}',
+            name = f'supplementary_item_status.{page_index}.{line_number}',
             tooltip = 'Status',
             x = 26.5 * mm,
             y = letter[1] - (base_y * mm) - (line_number * 8.75 * mm),
@@ -700,7 +701,7 @@ def add_supplementary_sheet_form(canvas: Canvas, da_2404: Da2404, page_number):
             value = line_item.status
         )
         form.textfield(
-            name = f'supplementary_deficiencies_{line_number}_{page_index}',
+            name = f'supplementary_deficiencies.{page_index}.{line_number}',
             tooltip = 'Deficiencies',
             x = 40 * mm,
             y = letter[1] - (base_y * mm) - (line_number * 8.75 * mm),
@@ -712,7 +713,7 @@ def add_supplementary_sheet_form(canvas: Canvas, da_2404: Da2404, page_number):
             value = line_item.deficiencies
         )
         form.textfield(
-            name = f'supplementary_corrective_action_{line_number}_{page_index}',
+            name = f'supplementary_corrective_action.{page_index}.{line_number}',
             tooltip = 'Corrective Action',
             x = 111 * mm,
             y = letter[1] - (base_y * mm) - (line_number * 8.75 * mm),
@@ -738,11 +739,74 @@ def get_supplementary_sheets(sheet_count):
     return sheets
 
 
-def create_da_2404(da_2404: Da2404) -> BytesIO:
+def get_form_field_values(da_2404: Da2404, supplementary_sheet_count = None) -> dict:
+    """
+    Maps each AcroForm field name used by the ``add_*_form`` functions to its value for ``da_2404``.
+    """
+    if supplementary_sheet_count is None:
+        supplementary_sheet_count = get_supplementary_sheet_count(da_2404)
+    values = {
+        'organization': da_2404.organization,
+        'nomenclature': da_2404.nomenclature,
+        'nsn': da_2404.nsn,
+        'miles': da_2404.miles,
+        'hours': da_2404.hours,
+        'rounds_fired': da_2404.rounds_fired,
+        'hot_starts': da_2404.hot_starts,
+        'date': da_2404.date,
+        'type_inspection': da_2404.type_inspection,
+        'tm_number_a': da_2404.tm_number_a,
+        'tm_date_a': da_2404.tm_date_a,
+        'tm_number_b': da_2404.tm_number_b,
+        'tm_date_b': da_2404.tm_date_b,
+        'time_a': da_2404.time_a,
+        'time_b': da_2404.time_b,
+        'man_hours': da_2404.man_hours_required,
+    }
+    for line_number in range(0, MAIN_PAGE_ITEMS):
+        line_item = get_line_item(da_2404, line_number)
+        values[f'main_item_number.{line_number}'] = line_item.item_number
+        values[f'main_item_status.{line_number}'] = line_item.status
+        values[f'main_deficiencies.{line_number}'] = line_item.deficiencies
+        values[f'main_corrective_action.{line_number}'] = line_item.corrective_action
+    for page_index in range(0, supplementary_sheet_count):
+        for line_number in range(0, SUPPLEMENTARY_PAGE_ITEMS):
+            line_item = get_line_item(
+                da_2404,
+                line_number + MAIN_PAGE_ITEMS + (SUPPLEMENTARY_PAGE_ITEMS * page_index)
+            )
+            suffix = f'{page_index}.{line_number}'
+            values[f'supplementary_item_number.{suffix}'] = line_item.item_number
+            values[f'supplementary_item_status.{suffix}'] = line_item.status
+            values[f'supplementary_deficiencies.{suffix}'] = line_item.deficiencies
+            values[f'supplementary_corrective_action.{suffix}'] = line_item.corrective_action
+    return values
+
+
+def linearize_pdf(pdf_buffer: BytesIO) -> BytesIO:
+    """
+    Rewrites the PDF in ``pdf_buffer`` as a linearized ("fast web view") PDF so viewers can display the first
+    page and its fields before the remaining supplementary sheets have downloaded.
+    """
+    try:
+        import pikepdf
+    except ImportError as e:
+        raise ImportError('Linearized output requires pikepdf; install the "linearize" extra') from e
+
+    linearized_buffer = BytesIO()
+    pdf_buffer.seek(0)
+    with pikepdf.open(pdf_buffer) as pdf:
+        pdf.save(linearized_buffer, linearize = True)
+    pdf_buffer.close()
+    return linearized_buffer
+
+
+def create_da_2404(da_2404: Da2404, supplementary_sheet_count = None, linearize: bool = False) -> BytesIO:
     logger.info('Generating DA 2404')
     margin = 10 * mm
 
-    supplementary_sheet_count = get_supplementary_sheet_count(da_2404)
+    if supplementary_sheet_count is None:
+        supplementary_sheet_count = get_supplementary_sheet_count(da_2404)
 
     pdf_buffer = BytesIO()
 
@@ -781,15 +845,13 @@ def create_da_2404(da_2404: Da2404) -> BytesIO:
 
     logger.info('Built DA 2404')
 
-    return pdf_buffer
+    if linearize:
+        pdf_buffer = linearize_pdf(pdf_buffer)
+        logger.info('Linearized DA 2404')
 
+    return pdf_buffer
 
-def write_to_file(output_path: str = 'dist/DA2404.pdf'):
-    if not os.path.exists(os.path.dirname(output_path)):
-        os.makedirs(os.path.dirname(output_path))
 
+def write_to_file(output_path: str = 'dist/DA2404.pdf', linearize: bool = False):
     da_fields = Da2404()
-    buffer = create_da_2404(da_fields)
-    with open(output_path, 'wb+') as file:
-        file.write(buffer.getvalue())
-    buffer.close()
+    write_buffer_to_file(output_path, create_da_2404(da_fields, linearize = linearize))
@@ -5,6 +5,9 @@ class Da2404LineItem:
         self.deficiencies = kwargs.get('deficiencies', '')
         self.corrective_action = kwargs.get('corrective_action', '')
 
+    def to_dict(self) -> dict:
+        return dict(vars(self))
+
 
 class Da2404:
     def __init__(self, **kwargs):
@@ -25,3 +28,6 @@ class Da2404:
         self.time_b = kwargs.get('time_b', '')
         self.man_hours_required = kwargs.get('man_hours_required', '')
         self.line_items = list(map(lambda v: Da2404LineItem(**v), kwargs.get('line_items', [])))
+
+    def to_dict(self) -> dict:
+        return {**vars(self), 'line_items': [line_item.to_dict() for line_item in self.line_items]}
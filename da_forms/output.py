@@ -0,0 +1,12 @@
+import os.path
+from io import BytesIO
+
+
+def write_buffer_to_file(output_path: str, buffer: BytesIO):
+    output_dir = os.path.dirname(output_path)
+    if output_dir and not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+
+    with open(output_path, 'wb+') as file:
+        file.write(buffer.getvalue())
+    buffer.close()
@@ -0,0 +1,113 @@
+import json
+import os
+import socket
+import tempfile
+import threading
+import time
+
+import pytest
+
+from da_forms import generate
+from da_forms.client import DaemonError, create_da_2404, main, request_da_2404
+from da_forms.daemon import RenderServer
+from da_forms.models import Da2404
+
+
+def test_request_da_2404():
+    socket_path = os.path.join(tempfile.mkdtemp(), 'da_forms.sock')
+    with RenderServer(socket_path) as server:
+        thread = threading.Thread(target = server.serve_forever)
+        thread.start()
+        try:
+            da_2404 = Da2404(organization = 'A Co', line_items = [{'status': 'X'} for i in range(20)])
+            buffer = request_da_2404(da_2404, socket_path = socket_path)
+        finally:
+            server.shutdown()
+            thread.join()
+    assert buffer.getvalue().startswith(b'%PDF')
+    assert b'(A Co)' in buffer.getvalue()
+    assert not os.path.exists(socket_path)
+
+
+def test_create_da_2404_without_daemon():
+    socket_path = os.path.join(tempfile.mkdtemp(), 'missing.sock')
+    buffer = create_da_2404(Da2404(organization = 'A Co'), socket_path = socket_path)
+    assert buffer.getvalue().startswith(b'%PDF')
+
+
+def test_render_server_keeps_running_daemon_socket():
+    socket_path = os.path.join(tempfile.mkdtemp(), 'da_forms.sock')
+    with RenderServer(socket_path):
+        with pytest.raises(DaemonError):
+            RenderServer(socket_path)
+        assert os.path.exists(socket_path)
+
+
+def test_render_server_removes_stale_socket():
+    socket_path = os.path.join(tempfile.mkdtemp(), 'da_forms.sock')
+    stale_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale_socket.bind(socket_path)
+    stale_socket.close()
+    with RenderServer(socket_path) as server:
+        assert server.socket_path == socket_path
+
+
+def test_request_da_2404_times_out():
+    socket_path = os.path.join(tempfile.mkdtemp(), 'da_forms.sock')
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as unresponsive_daemon:
+        unresponsive_daemon.bind(socket_path)
+        unresponsive_daemon.listen()
+        with pytest.raises(socket.timeout):
+            request_da_2404(Da2404(), socket_path = socket_path, response_timeout = 0.1)
+
+
+def test_request_da_2404_rejects_shared_directory():
+    socket_dir = tempfile.mkdtemp()
+    os.chmod(socket_dir, 0o777)
+    with pytest.raises(PermissionError):
+        request_da_2404(Da2404(), socket_path = os.path.join(socket_dir, 'da_forms.sock'))
+
+
+def test_main_posts_payload_to_daemon(tmp_path, monkeypatch):
+    socket_path = os.path.join(tempfile.mkdtemp(), 'da_forms.sock')
+    payload_path = os.path.join(tmp_path, 'DA2404.json')
+    output_path = os.path.join(tmp_path, 'DA2404.pdf')
+    with open(payload_path, 'w') as file:
+        json.dump({'organization': 'B Co', 'line_items': [{'item_number': '7', 'status': 'CX'}]}, file)
+
+    def render_in_process(*args, **kwargs):
+        raise AssertionError('generate should have used the daemon')
+
+    monkeypatch.setenv('DA_FORMS_SOCKET', socket_path)
+    monkeypatch.setattr(generate, 'create_da_2404', render_in_process)
+    with RenderServer(socket_path) as server:
+        thread = threading.Thread(target = server.serve_forever)
+        thread.start()
+        try:
+            main([payload_path, '-o', output_path])
+        finally:
+            server.shutdown()
+            thread.join()
+
+    with open(output_path, 'rb') as file:
+        pdf = file.read()
+    assert b'/V (B Co)' in pdf
+    assert b'/V (7)' in pdf
+    assert b'/V (CX)' in pdf
+
+
+def test_render_server_drops_stalled_client():
+    socket_path = os.path.join(tempfile.mkdtemp(), 'da_forms.sock')
+    with RenderServer(socket_path) as server:
+        thread = threading.Thread(target = server.serve_forever)
+        thread.start()
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stalled_client:
+                stalled_client.connect(socket_path)
+                start = time.perf_counter()
+                buffer = request_da_2404(Da2404(), socket_path = socket_path, response_timeout = 10)
+                assert time.perf_counter() - start < 5
+        finally:
+            server.shutdown()
+            thread.join()
+    assert buffer.getvalue().startswith(b'%PDF')
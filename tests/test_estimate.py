@@ -0,0 +1,43 @@
+from da_forms.batch import create_da_2404_batch, schedule
+from da_forms.estimate import calibrate, estimate_da_2404
+from da_forms.models import Da2404
+
+
+def get_sample_2404(item_count):
+    return Da2404(
+        organization = 'A Co',
+        line_items = [
+            {'item_number': str(i), 'status': 'X', 'deficiencies': 'Leaking seal'} for i in range(item_count)
+        ]
+    )
+
+
+def test_estimate_da_2404():
+    estimate = estimate_da_2404(get_sample_2404(100))
+    assert estimate.page_count == 5
+    assert estimate.field_count == 16 + (4 * 13) + (4 * 27 * 4)
+    assert estimate.filled_field_count == 1 + (3 * 100)
+    assert estimate.render_seconds > estimate_da_2404(get_sample_2404(0)).render_seconds
+    assert 100_000 < estimate.output_bytes < 300_000
+
+
+def test_schedule_largest_first():
+    da_2404s = [get_sample_2404(item_count) for item_count in (0, 3000, 10, 400, 50, 1000)]
+    assignments = schedule(da_2404s, 2)
+    assert sorted(index for indexes in assignments for index in indexes) == list(range(6))
+    assert assignments[0][0] == 1
+    assert assignments[1][:2] == [5, 3]
+
+
+def test_calibrate():
+    cost_model = calibrate([get_sample_2404(item_count) for item_count in (0, 13, 60, 120)])
+    estimate = estimate_da_2404(get_sample_2404(60), cost_model)
+    assert estimate.render_seconds > 0
+    assert estimate.output_bytes > 0
+
+
+def test_create_da_2404_batch():
+    da_2404s = [get_sample_2404(item_count) for item_count in (0, 100)]
+    buffers = create_da_2404_batch(da_2404s, 2)
+    assert len(buffers) == 2
+    assert len(buffers[1].getvalue()) > len(buffers[0].getvalue())
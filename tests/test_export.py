@@ -0,0 +1,85 @@
+import os
+import re
+from xml.etree import ElementTree
+
+import pytest
+
+from da_forms.export import (XFDF_NAMESPACE, create_fdf, create_xfdf, get_filled_field_values, get_template_name,
+                             write_data_to_file)
+from da_forms.models import Da2404
+
+
+def get_sample_2404():
+    return Da2404(
+        organization = 'A Co (1-1 IN)',
+        nomenclature = 'Truck, Utility',
+        line_items = [{'item_number': str(i), 'status': 'X'} for i in range(20)]
+    )
+
+
+def test_create_fdf():
+    fdf = create_fdf(get_sample_2404())
+    assert fdf.startswith(b'%FDF-1.2')
+    assert f'/F({get_template_name(1)})'.encode() in fdf
+    assert b'<</T(organization)/V(A Co \\(1-1 IN\\))>>' in fdf
+    assert b'<</T(supplementary_item_status)/Kids[<</T(0)/Kids[<</T(0)/V(X)>>' in fdf
+    assert b'nsn' not in fdf
+    assert len(fdf) < 2048
+
+
+def test_create_xfdf():
+    xfdf = create_xfdf(get_sample_2404())
+    assert f'<f href="{get_template_name(1)}" />'.encode() in xfdf
+    assert b'<field name="main_item_status"><field name="0"><value>X</value></field>' in xfdf
+
+
+def get_fdf_values(fields, parent_name = ''):
+    values = {}
+    for field in fields:
+        name = parent_name + str(field.T)
+        if '/Kids' in field:
+            values.update(get_fdf_values(field.Kids, name + '.'))
+        else:
+            values[name] = str(field.V)
+    return values
+
+
+def get_xfdf_values(element, parent_name = ''):
+    values = {}
+    for field in element.findall(f'{{{XFDF_NAMESPACE}}}field'):
+        name = parent_name + field.get('name')
+        value = field.find(f'{{{XFDF_NAMESPACE}}}value')
+        if value is None:
+            values.update(get_xfdf_values(field, name + '.'))
+        else:
+            values[name] = value.text
+    return values
+
+
+def import_into_template(template_path, values):
+    pikepdf = pytest.importorskip('pikepdf')
+    with pikepdf.open(template_path) as pdf:
+        fields = {field.fully_qualified_name: field for field in pdf.acroform.fields}
+        assert set(values) <= set(fields)
+        for name, value in values.items():
+            fields[name].set_value(value)
+        return {name: field.value_as_string for name, field in fields.items() if field.value_as_string}
+
+
+@pytest.mark.parametrize('extension', ['fdf', 'xfdf'])
+def test_write_data_to_file(extension, tmp_path):
+    pikepdf = pytest.importorskip('pikepdf')
+    da_2404 = get_sample_2404()
+    output_path = os.path.join(tmp_path, f'DA2404_Sample.{extension}')
+    template_path = write_data_to_file(da_2404, output_path)
+    assert template_path == os.path.join(tmp_path, get_template_name(1))
+
+    with open(output_path, 'rb') as file:
+        data = file.read()
+    if extension == 'fdf':
+        fdf = pikepdf.Object.parse(re.search(rb'1 0 obj\n(.*)\nendobj', data, re.DOTALL).group(1))
+        values = get_fdf_values(fdf.FDF.Fields)
+    else:
+        values = get_xfdf_values(ElementTree.fromstring(data).find(f'{{{XFDF_NAMESPACE}}}fields'))
+
+    assert import_into_template(template_path, values) == get_filled_field_values(da_2404)
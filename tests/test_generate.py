@@ -1,6 +1,13 @@
 import os
+import re
+from io import BytesIO
 
-from da_forms.generate import write_to_file
+import pytest
+from reportlab.pdfgen.canvas import Canvas
+
+from da_forms.acroform import get_acro_form
+from da_forms.generate import create_da_2404, get_form_field_values, get_supplementary_sheet_count, write_to_file
+from da_forms.models import Da2404
 
 
 def test_create_2404():
@@ -8,3 +15,52 @@ def test_create_2404():
     write_to_file(output_dir)
     assert os.path.exists(output_dir)
     print('Successfully created 2404 PDF')
+
+
+def test_create_linearized_2404():
+    pikepdf = pytest.importorskip('pikepdf')
+    da_2404 = Da2404(line_items = [{'item_number': str(i)} for i in range(60)])
+    buffer = create_da_2404(da_2404, linearize = True)
+    pdf_bytes = buffer.getvalue()
+
+    # The linearization parameter dictionary must be the first object in the file
+    first_object = re.search(rb'\d+ 0 obj\s*<<(.*?)>>', pdf_bytes[:1024], re.DOTALL)
+    assert first_object is not None
+    parameters = first_object.group(1)
+    assert re.search(rb'/Linearized 1', parameters)
+    assert int(re.search(rb'/L (\d+)', parameters).group(1)) == len(pdf_bytes)
+    assert int(re.search(rb'/N (\d+)', parameters).group(1)) == 1 + get_supplementary_sheet_count(da_2404)
+    assert re.search(rb'/H \[ ?\d+ \d+ ?\]', parameters)
+
+    with pikepdf.open(BytesIO(pdf_bytes)) as pdf:
+        assert pdf.is_linearized
+        assert int(re.search(rb'/O (\d+)', parameters).group(1)) == pdf.pages[0].objgen[0]
+        pdf.check_linearization()
+
+
+def test_form_shares_appearances_and_parent_fields():
+    da_2404 = Da2404(line_items = [{'status': 'X'} for i in range(60)])
+    pdf_bytes = create_da_2404(da_2404).getvalue()
+
+    widget_count = len(re.findall(rb'/Subtype /Widget', pdf_bytes))
+    appearance_count = len(re.findall(rb'/Subtype /Form', pdf_bytes))
+    assert widget_count == 16 + (4 * 13) + (4 * 27 * 2)
+    assert appearance_count < 20
+    assert len(re.findall(rb'/Name /Helv ', pdf_bytes)) == 1
+    assert b'/T (main_item_status)' in pdf_bytes
+    assert b'/T (main_item_status_0)' not in pdf_bytes
+
+
+def test_form_field_names_match_field_values():
+    pikepdf = pytest.importorskip('pikepdf')
+    da_2404 = Da2404(line_items = [{'status': 'X'} for i in range(60)])
+    with pikepdf.open(create_da_2404(da_2404)) as pdf:
+        field_names = [field.fully_qualified_name for field in pdf.acroform.fields]
+    assert sorted(field_names) == sorted(get_form_field_values(da_2404))
+
+
+def test_get_acro_form_rejects_stock_form():
+    canvas = Canvas(BytesIO())
+    assert canvas.acroForm is not None
+    with pytest.raises(TypeError):
+        get_acro_form(canvas)